@@ -7,6 +7,7 @@ from collections.abc import AsyncIterator, Awaitable, Iterator, Sequence
 from contextlib import asynccontextmanager, contextmanager
 from contextvars import ContextVar
 from dataclasses import field
+from functools import lru_cache
 from typing import TYPE_CHECKING, Any, Callable, Generic, Literal, Union, cast
 
 from opentelemetry.trace import Tracer
@@ -831,17 +832,26 @@ def get_captured_run_messages() -> _RunMessages:
 def build_agent_graph(
     name: str | None, deps_type: type[DepsT], output_type: type[OutputT] | ToolOutput[OutputT]
 ) -> Graph[GraphAgentState, GraphAgentDeps[DepsT, result.FinalResult[OutputT]], result.FinalResult[OutputT]]:
-    """Build the execution [Graph][pydantic_graph.Graph] for a given agent."""
+    """Build the execution [Graph][pydantic_graph.Graph] for a given agent.
+
+    `deps_type` and `output_type` only parameterize the graph's types, so the graph itself is built once per
+    agent name and reused across runs, rather than re-resolving the node definitions on every run.
+    """
+    return _build_agent_graph(name or 'Agent')
+
+
+@lru_cache(maxsize=128)
+def _build_agent_graph(name: str) -> Graph[GraphAgentState, GraphAgentDeps[Any, Any], result.FinalResult[Any]]:
     nodes = (
-        UserPromptNode[DepsT],
-        ModelRequestNode[DepsT],
-        CallToolsNode[DepsT],
+        UserPromptNode[Any],
+        ModelRequestNode[Any],
+        CallToolsNode[Any],
     )
-    graph = Graph[GraphAgentState, GraphAgentDeps[DepsT, Any], result.FinalResult[OutputT]](
+    graph = Graph[GraphAgentState, GraphAgentDeps[Any, Any], result.FinalResult[Any]](
         nodes=nodes,
-        name=name or 'Agent',
+        name=name,
         state_type=GraphAgentState,
-        run_end_type=result.FinalResult[OutputT],
+        run_end_type=result.FinalResult[Any],
         auto_instrument=False,
     )
     return graph
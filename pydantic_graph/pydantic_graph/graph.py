@@ -6,11 +6,10 @@ from collections.abc import AsyncIterator, Sequence
 from contextlib import AbstractContextManager, ExitStack, asynccontextmanager
 from dataclasses import dataclass, field
 from functools import cached_property
-from typing import Any, Generic, cast, overload
+from typing import TYPE_CHECKING, Any, Generic, cast, overload
 
 import logfire_api
 import typing_extensions
-from opentelemetry.trace import Span
 from typing_extensions import deprecated
 from typing_inspection import typing_objects
 
@@ -20,6 +19,11 @@ from .nodes import BaseNode, DepsT, End, GraphRunContext, NodeDef, RunEndT, Stat
 from .persistence import BaseStatePersistence
 from .persistence.in_mem import SimpleStatePersistence
 
+if TYPE_CHECKING:
+    from pathlib import Path
+
+    from opentelemetry.trace import Span
+
 # while waiting for https://github.com/pydantic/logfire/issues/745
 try:
     import logfire._internal.stack_info
@@ -30,6 +30,9 @@ class GraphRunContext(Generic[StateT, DepsT]):
 
     # TODO: Can we get rid of this struct and just pass both these things around..?
 
+    # a new context is created for every node run, slots avoid allocating a `__dict__` for each one
+    __slots__ = 'state', 'deps'
+
     state: StateT
     """The state of the graph."""
     deps: DepsT
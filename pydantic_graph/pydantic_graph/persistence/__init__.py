@@ -4,6 +4,7 @@ from abc import ABC, abstractmethod
 from contextlib import AbstractAsyncContextManager
 from dataclasses import dataclass, field
 from datetime import datetime
+from functools import lru_cache
 from typing import TYPE_CHECKING, Annotated, Any, Generic, Literal, Union
 
 import pydantic
@@ -234,5 +235,25 @@ def build_snapshot_list_type_adapter(
     [`set_types`][pydantic_graph.persistence.BaseStatePersistence.set_types]
     where context variables will be set such that Pydantic can create a schema for
     [`NodeSnapshot.node`][pydantic_graph.persistence.NodeSnapshot.node].
+
+    Type adapters are cached by the graph's nodes, state type and run end type, so persistence instances
+    created for each run of the same graph reuse the same schema rather than rebuilding it.
     """
+    nodes = _utils.nodes_type_context.get(None)
+    if nodes is not None:
+        return _cached_snapshot_list_type_adapter(tuple(nodes), state_t, run_end_t)
+    return _snapshot_list_type_adapter(state_t, run_end_t)
+
+
+@lru_cache(maxsize=128)
+def _cached_snapshot_list_type_adapter(
+    nodes: tuple[type[BaseNode[Any, Any, Any]], ...], state_t: type[StateT], run_end_t: type[RunEndT]
+) -> pydantic.TypeAdapter[list[Snapshot[StateT, RunEndT]]]:
+    with _utils.set_nodes_type_context(nodes):
+        return _snapshot_list_type_adapter(state_t, run_end_t)
+
+
+def _snapshot_list_type_adapter(
+    state_t: type[StateT], run_end_t: type[RunEndT]
+) -> pydantic.TypeAdapter[list[Snapshot[StateT, RunEndT]]]:
     return pydantic.TypeAdapter(list[Annotated[Snapshot[state_t, run_end_t], pydantic.Discriminator('kind')]])
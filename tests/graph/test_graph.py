@@ -478,3 +478,9 @@ async def test_deps(mock_snapshot_id: object):
             EndSnapshot(state=None, result=End(data=123), ts=IsNow(tz=timezone.utc), id='end:3'),
         ]
     )
+
+
+def test_graph_run_context_slots():
+    ctx = GraphRunContext(None, None)
+    assert not hasattr(ctx, '__dict__')
+    assert (ctx.state, ctx.deps) == (None, None)
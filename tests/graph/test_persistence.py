@@ -345,3 +345,19 @@ async def test_record_lookup_error(persistence_cls: type[BaseStatePersistence]):
 def test_snapshot_type_adapter_error():
     with pytest.raises(RuntimeError, match='Unable to build a Pydantic schema for `BaseNode` without setting'):
         build_snapshot_list_type_adapter(int, int)
+
+
+def test_snapshot_type_adapter_cached():
+    g = Graph(nodes=(Foo, Bar))
+
+    sp1 = FullStatePersistence()
+    sp1.set_graph_types(g)
+    sp2 = FullStatePersistence()
+    sp2.set_graph_types(g)
+    assert sp1._snapshots_type_adapter is not None
+    assert sp2._snapshots_type_adapter is sp1._snapshots_type_adapter
+
+    other_graph = Graph(nodes=(Foo, Bar), run_end_type=str)
+    sp3 = FullStatePersistence()
+    sp3.set_graph_types(other_graph)
+    assert sp3._snapshots_type_adapter is not sp1._snapshots_type_adapter
@@ -1966,3 +1966,16 @@ def test_agent_run_result_serialization() -> None:
     # Check that we can load the data back
     deserialized_result = adapter.validate_json(serialized_data)
     assert deserialized_result == result
+
+
+async def test_agent_graph_reused_across_runs():
+    agent = Agent('test', name='reused_graph_agent')
+
+    async with agent.iter('Hello') as first_run:
+        pass
+    async with agent.iter('Hello', output_type=int) as second_run:
+        pass
+
+    graph = first_run._graph_run.graph  # pyright: ignore[reportPrivateUsage]
+    assert second_run._graph_run.graph is graph  # pyright: ignore[reportPrivateUsage]
+    assert graph.name == 'reused_graph_agent'